@@ -9,6 +9,7 @@ from .server import (
     mark_task_complete,
     check_all_tasks_complete,
     list_task_files,
+    read_task_list,
     extract_tasks,
     format_plan_sections,
     TASKS_FOLDER,
@@ -3,6 +3,8 @@ import re
 import json
 import asyncio
 import os
+import hashlib
+from collections import deque
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
 from mcp.server.fastmcp import FastMCP
@@ -13,6 +15,10 @@ mcp = FastMCP("tasks-organizer")
 # Constants
 TASKS_FOLDER = ".tasks"
 COMPLETED_PREFIX = "✅"
+VERSION_HISTORY_SIZE = 20
+
+# Recent versions of each task list, keyed by (repo path, description)
+_version_history: Dict[Tuple[str, str], deque] = {}
 
 @mcp.tool()
 async def create_task_list(
@@ -57,7 +63,8 @@ async def create_task_list(
     with open(file_path, 'w') as file:
         file.write(markdown)
     
-    return f"Created task list at {file_path}"
+    version = record_version(description, repo_path, markdown)
+    return f"Created task list at {file_path} (version: {version})"
 
 @mcp.tool()
 async def convert_plan_to_tasks(
@@ -115,7 +122,8 @@ async def convert_plan_to_tasks(
     with open(file_path, 'w') as file:
         file.write(markdown)
     
-    return f"Created task list at {file_path}"
+    version = record_version(description, repo_path, markdown)
+    return f"Created task list at {file_path} (version: {version})"
 
 @mcp.tool()
 async def add_task(
@@ -185,7 +193,8 @@ async def add_task(
     with open(task_file, 'w') as file:
         file.write(updated_content)
     
-    return f"Added task '{task_text}' to {os.path.basename(task_file)}"
+    version = record_version(description, repo_path, updated_content)
+    return f"Added task '{task_text}' to {os.path.basename(task_file)} (version: {version})"
 
 @mcp.tool()
 async def mark_task_complete(
@@ -250,7 +259,8 @@ async def mark_task_complete(
     with open(task_file, 'w') as file:
         file.write(updated_content)
     
-    return f"Marked task {task_number} as complete in {os.path.basename(task_file)}"
+    version = record_version(description, repo_path, updated_content)
+    return f"Marked task {task_number} as complete in {os.path.basename(task_file)} (version: {version})"
 
 @mcp.tool()
 async def check_all_tasks_complete(
@@ -286,6 +296,7 @@ async def check_all_tasks_complete(
         return f"Task list has {incomplete_task_count} incomplete tasks. Cannot mark as completed."
     
     # If all tasks are complete, rename the file with the ✅ prefix
+    version = record_version(description, repo_path, content)
     filename = os.path.basename(task_file)
     if not filename.startswith(COMPLETED_PREFIX):
         task_dir = os.path.dirname(task_file)
@@ -293,9 +304,9 @@ async def check_all_tasks_complete(
         new_file_path = os.path.join(task_dir, new_filename)
         
         os.rename(task_file, new_file_path)
-        return f"All tasks complete! Renamed task list to {new_filename}"
+        return f"All tasks complete! Renamed task list to {new_filename} (version: {version})"
     else:
-        return "All tasks are already complete and the list is marked as completed."
+        return f"All tasks are already complete and the list is marked as completed (version: {version})."
 
 @mcp.tool()
 async def list_task_files(
@@ -335,6 +346,62 @@ async def list_task_files(
     
     return result
 
+@mcp.tool()
+async def read_task_list(
+    description: str,
+    repo_path: str = ".",
+    if_version: str = ""
+) -> str:
+    """Read a task list, optionally only the changes since a known version.
+    
+    Every mutating tool returns the list's version. Passing it back as
+    `if_version` avoids re-reading the whole file: the response is either
+    "unchanged" or a compact task-level diff. If the version is unknown
+    (e.g. too old), or the diff would not be smaller than the list, the full
+    task list is returned instead. Every response ends with the current version.
+    
+    Args:
+        description: The description identifier of the task list file
+        repo_path: Path to the repository root (defaults to current directory)
+        if_version: Version previously returned by the server (optional)
+        
+    Returns:
+        The task list, "unchanged", or a diff of task-level changes
+    """
+    # Find the task file
+    task_file, content = find_task_file(description, repo_path)
+    if not task_file:
+        return f"Error: Could not find task list with description '{description}'"
+    
+    version = record_version(description, repo_path, content)
+    
+    if if_version:
+        if if_version == version:
+            return f"Task list unchanged (version: {version})"
+        
+        old_tasks = find_version_tasks(description, repo_path, if_version)
+        if old_tasks is not None:
+            changes = diff_task_items(old_tasks, parse_task_items(content))
+            diff_text = "\n".join(changes)
+            # Only send the diff if it is actually smaller than the list. Edits
+            # outside the tasks produce no changes, so the full list is sent.
+            if changes and len(diff_text) < len(content):
+                return f"Changes since version {if_version}:\n\n{diff_text}\n\n(version: {version})"
+    
+    return f"{content.rstrip()}\n\n(version: {version})"
+
+def normalize_description(description: str) -> str:
+    """Normalize a task list description to its filename form.
+    
+    Args:
+        description: The description identifier of the task list file
+        
+    Returns:
+        The sanitized description
+    """
+    safe_description = description.lower().replace(" ", "-")
+    return re.sub(r'[^a-z0-9\-]', '', safe_description)
+
 def find_task_file(description: str, repo_path: str) -> Tuple[Optional[str], Optional[str]]:
     """Find a task file by its description.
     
@@ -350,8 +417,7 @@ def find_task_file(description: str, repo_path: str) -> Tuple[Optional[str], Opt
         return None, None
     
     # Normalize description for comparison
-    safe_description = description.lower().replace(" ", "-")
-    safe_description = re.sub(r'[^a-z0-9\-]', '', safe_description)
+    safe_description = normalize_description(description)
     
     # Look for files that match the description
     for file in os.listdir(tasks_dir):
@@ -366,6 +432,131 @@ def find_task_file(description: str, repo_path: str) -> Tuple[Optional[str], Opt
     
     return None, None
 
+def compute_version(content: str) -> str:
+    """Compute a short content hash used as the version of a task list.
+    
+    Args:
+        content: The task list markdown
+        
+    Returns:
+        The version string
+    """
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+
+def parse_task_items(content: str) -> Dict[Tuple[str, int, int], Tuple[bool, str]]:
+    """Parse the numbered tasks of a task list, grouped by section.
+    
+    Sections are keyed by name and occurrence, since a list can repeat a
+    header (e.g. "### Steps" under each phase of a plan).
+    
+    Args:
+        content: The task list markdown
+        
+    Returns:
+        Mapping of (section, occurrence, task number) to (is_complete, task text),
+        in document order
+    """
+    tasks = {}
+    occurrences = {}
+    section = ""
+    task_number = 0
+    
+    for line in content.split('\n'):
+        if line.startswith('#'):
+            section = line.lstrip('#').strip()
+            occurrences[section] = occurrences.get(section, 0) + 1
+            task_number = 0
+            continue
+        
+        task_match = re.match(r'^\d+\.\s+\[([ x])\]\s*(.*)$', line)
+        if task_match:
+            task_number += 1
+            key = (section, occurrences.get(section, 1), task_number)
+            tasks[key] = (task_match.group(1) == 'x', task_match.group(2).strip())
+    
+    return tasks
+
+def record_version(description: str, repo_path: str, content: str) -> str:
+    """Remember the tasks of a task list version in the per-list history.
+    
+    Args:
+        description: The description identifier of the task list file
+        repo_path: Path to the repository root
+        content: The task list markdown
+        
+    Returns:
+        The version of the content
+    """
+    version = compute_version(content)
+    key = (os.path.abspath(repo_path), normalize_description(description))
+    history = _version_history.setdefault(key, deque(maxlen=VERSION_HISTORY_SIZE))
+    
+    if not history or history[-1][0] != version:
+        history.append((version, parse_task_items(content)))
+    
+    return version
+
+def find_version_tasks(
+    description: str,
+    repo_path: str,
+    version: str
+) -> Optional[Dict[Tuple[str, int, int], Tuple[bool, str]]]:
+    """Look up the tasks of a recent version of a task list.
+    
+    Args:
+        description: The description identifier of the task list file
+        repo_path: Path to the repository root
+        version: The version to look up
+        
+    Returns:
+        The parsed tasks, or None if the version is not in the history
+    """
+    key = (os.path.abspath(repo_path), normalize_description(description))
+    for recorded_version, tasks in reversed(_version_history.get(key, ())):
+        if recorded_version == version:
+            return tasks
+    
+    return None
+
+def diff_task_items(
+    old_tasks: Dict[Tuple[str, int, int], Tuple[bool, str]],
+    new_tasks: Dict[Tuple[str, int, int], Tuple[bool, str]]
+) -> List[str]:
+    """Describe task-level changes between two parsed versions of a task list.
+    
+    Args:
+        old_tasks: Tasks of the older version
+        new_tasks: Tasks of the newer version
+        
+    Returns:
+        One line per added (+), removed (-) or changed (~) task, in the new
+        version's document order followed by removed tasks. Repeated sections
+        after the first are labelled with their occurrence, e.g. "Tasks (2)".
+    """
+    changes = []
+    removed_keys = [key for key in old_tasks if key not in new_tasks]
+    
+    for key in list(new_tasks) + removed_keys:
+        section, occurrence, task_number = key
+        if occurrence > 1:
+            section = f"{section} ({occurrence})"
+        old = old_tasks.get(key)
+        new = new_tasks.get(key)
+        if old == new:
+            continue
+        
+        if old is None:
+            marker, (is_complete, text) = "+", new
+        elif new is None:
+            marker, (is_complete, text) = "-", old
+        else:
+            marker, (is_complete, text) = "~", new
+        
+        checkbox = "[x]" if is_complete else "[ ]"
+        changes.append(f"{marker} {section} #{task_number}: {checkbox} {text}")
+    
+    return changes
+
 def extract_tasks(text: str) -> List[str]:
     """Extract tasks from the plan text.
     
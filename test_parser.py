@@ -9,7 +9,8 @@ from tasks_organizer.server import (
     extract_tasks, format_plan_sections, 
     convert_plan_to_tasks, create_task_list, 
     add_task, mark_task_complete,
-    check_all_tasks_complete, list_task_files
+    check_all_tasks_complete, list_task_files,
+    read_task_list, VERSION_HISTORY_SIZE
 )
 import asyncio
 
@@ -151,6 +152,144 @@ async def test_task_management():
             shutil.rmtree(test_dir)
             print("\nCleaned up test directory")
 
+async def test_versioned_reads():
+    """Test version-based conditional reads of a task list."""
+    print("\n=== TESTING VERSIONED READS ===\n")
+    
+    # Create a test directory
+    test_dir = "test_repo"
+    if os.path.exists(test_dir):
+        shutil.rmtree(test_dir)
+    os.makedirs(test_dir)
+    
+    try:
+        task_file = os.path.join(test_dir, ".tasks", "versioned-list.md")
+        
+        def edit_externally(old, new):
+            with open(task_file, 'r') as file:
+                content = file.read()
+            with open(task_file, 'w') as file:
+                file.write(content.replace(old, new))
+        
+        def version_of(result):
+            return result.rsplit("(version: ", 1)[1].split(")")[0]
+        
+        # 1. Create a list and add tasks, keeping the returned version
+        print("\n1. Creating a task list with tasks...")
+        await create_task_list("Versioned List", "versioned-list", test_dir, False)
+        for task in ["First task", "Second task", "Third task", "Fourth task"]:
+            result = await add_task("versioned-list", task, test_dir)
+        print(result)
+        version = version_of(result)
+        
+        # 2. Reading with the current version should report no changes
+        print("\n2. Reading with the current version...")
+        result = await read_task_list("versioned-list", test_dir, version)
+        print(result)
+        assert "unchanged" in result
+        
+        # 3. After mutations, reading should return only the diff
+        print("\n3. Reading after further changes...")
+        await mark_task_complete("versioned-list", 1, test_dir)
+        result = await add_task("versioned-list", "Fifth task", test_dir)
+        current_version = version_of(result)
+        result = await read_task_list("versioned-list", test_dir, version)
+        print(result)
+        assert "~ Tasks #1: [x] First task" in result
+        assert "+ Tasks #5: [ ] Fifth task" in result
+        assert "Second task" not in result
+        
+        # 4. Edits outside the server that don't touch tasks return the full list
+        print("\n4. Reading after an outside edit of the title...")
+        edit_externally("# Versioned List", "# Renamed List")
+        result = await read_task_list("versioned-list", test_dir, current_version)
+        print(result)
+        assert "Changes since" not in result
+        assert "# Renamed List" in result
+        current_version = version_of(result)
+        
+        # 5. A task removed outside the server
+        print("\n5. Reading after an outside removal of a task...")
+        edit_externally("5. [ ] Fifth task", "")
+        result = await read_task_list("versioned-list", test_dir, current_version)
+        print(result)
+        assert "- Tasks #5: [ ] Fifth task" in result
+        current_version = version_of(result)
+        
+        # 6. A diff as large as the list should fall back to the full list
+        print("\n6. Reading after an outside insertion at the top...")
+        edit_externally("1. [x] First task", "1. [ ] New first task\n2. [x] First task")
+        result = await read_task_list("versioned-list", test_dir, current_version)
+        print(result)
+        assert "Changes since" not in result
+        assert "# Renamed List" in result
+        
+        # 7. An unknown version should fall back to the full list
+        print("\n7. Reading with an unknown version...")
+        result = await read_task_list("versioned-list", test_dir, "unknown")
+        print(result)
+        assert "# Renamed List" in result
+        
+        # 8. Versions older than the history should fall back to the full list
+        print("\n8. Reading with a version dropped from the history...")
+        edit_externally("1. [ ] New first task\n", "")
+        result = await read_task_list("versioned-list", test_dir)
+        old_version = version_of(result)
+        title = "# Renamed List"
+        for i in range(VERSION_HISTORY_SIZE):
+            edit_externally(title, f"# Renamed List {i}")
+            title = f"# Renamed List {i}"
+            await read_task_list("versioned-list", test_dir)
+        edit_externally("[x] First task", "[x] First task, edited")
+        result = await read_task_list("versioned-list", test_dir, old_version)
+        print(result)
+        assert "Changes since" not in result
+        assert f"{title}\n" in result
+        
+        # 9. Repeated section names should not hide changes
+        print("\n9. Reading a list with repeated section names...")
+        with open(os.path.join(test_dir, ".tasks", "dup.md"), 'w') as file:
+            file.write(
+                "# Dup\n\n## Tasks\n\n1. [ ] A\n2. [ ] B\n\n"
+                "## Other\n\n1. [ ] C\n2. [ ] D\n\n"
+                "## Tasks\n\n1. [ ] E\n2. [ ] F\n"
+            )
+        result = await read_task_list("dup", test_dir)
+        dup_version = version_of(result)
+        result = await mark_task_complete("dup", 1, test_dir)
+        result = await read_task_list("dup", test_dir, dup_version)
+        print(result)
+        assert "~ Tasks #1: [x] A" in result
+        
+        # 10. Changes in a repeated section should name its occurrence
+        print("\n10. Reading after a change in the second repeated section...")
+        dup_version = version_of(result)
+        with open(os.path.join(test_dir, ".tasks", "dup.md"), 'r') as file:
+            content = file.read()
+        with open(os.path.join(test_dir, ".tasks", "dup.md"), 'w') as file:
+            file.write(content.replace("1. [ ] E", "1. [x] E"))
+        result = await read_task_list("dup", test_dir, dup_version)
+        print(result)
+        assert "~ Tasks (2) #1: [x] E" in result
+        assert "~ Tasks #1" not in result
+        
+        # 11. Small lists still get a diff when it is shorter than the list
+        print("\n11. Ticking the only task of a one-task list...")
+        await create_task_list("Single", "single", test_dir, False)
+        result = await add_task("single", "Only task with a fairly long description", test_dir)
+        single_version = version_of(result)
+        await mark_task_complete("single", 1, test_dir)
+        result = await read_task_list("single", test_dir, single_version)
+        print(result)
+        assert "~ Tasks #1: [x] Only task with a fairly long description" in result
+        
+    finally:
+        # Clean up test directory
+        if os.path.exists(test_dir):
+            shutil.rmtree(test_dir)
+            print("\nCleaned up test directory")
+
 if __name__ == "__main__":
     asyncio.run(test_parser())
-    asyncio.run(test_task_management()) 
\ No newline at end of file
+    asyncio.run(test_task_management())
+    asyncio.run(test_versioned_reads()) 
\ No newline at end of file